@@ -10,7 +10,7 @@ Configuration used:
 
 Dependencies:
  - Required: psutil
- - Optional: gputil, matplotlib, simpleaudio
+ - Optional: nvidia-ml-py (pynvml) or gputil, matplotlib, simpleaudio
 
 Save as: cinnaos_win98_full.py
 Run: python cinnaos_win98_full.py
@@ -24,7 +24,13 @@ import os
 import sys
 import time
 import threading
+import queue
 import json
+import atexit
+import errno
+import shutil
+import ast
+import functools
 from pathlib import Path
 import tkinter as tk
 from tkinter import ttk, filedialog, colorchooser, messagebox
@@ -37,31 +43,90 @@ except Exception:
     print("psutil is required. Install: pip install psutil")
     raise
 
-try:
-    import GPUtil
-    GPUtil_available = True
-except Exception:
-    GPUtil_available = False
+# GPUtil and matplotlib are heavy; they are imported on first use by the
+# _ensure_* helpers. None = not tried yet, then True/False.
+GPUtil = None
+GPUtil_available = None
+pynvml = None
+NVML_AVAILABLE = None
+_NVML_HANDLE = None
+_NVML_NAME = None
+Figure = FigureCanvasTkAgg = np = None
+MATPLOTLIB_AVAILABLE = None
+
+
+def _ensure_gputil():
+    global GPUtil, GPUtil_available
+    if GPUtil_available is None:
+        try:
+            import GPUtil as _gputil
+            GPUtil = _gputil
+            GPUtil_available = True
+        except Exception:
+            GPUtil_available = False
+    return GPUtil_available
 
-try:
-    import matplotlib
-    matplotlib.use("TkAgg")
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-    from matplotlib.figure import Figure
-    MATPLOTLIB_AVAILABLE = True
-except Exception:
-    MATPLOTLIB_AVAILABLE = False
+
+def _ensure_nvml():
+    """Initialise NVML once; preferred over GPUtil, which shells out to nvidia-smi."""
+    global pynvml, NVML_AVAILABLE, _NVML_HANDLE, _NVML_NAME
+    if NVML_AVAILABLE is None:
+        try:
+            import pynvml as _nvml
+            _nvml.nvmlInit()
+            try:
+                _NVML_HANDLE = _nvml.nvmlDeviceGetHandleByIndex(0)
+                name = _nvml.nvmlDeviceGetName(_NVML_HANDLE)
+            except Exception:
+                _nvml.nvmlShutdown()
+                raise
+            _NVML_NAME = name.decode() if isinstance(name, bytes) else name
+            pynvml = _nvml
+            NVML_AVAILABLE = True
+            atexit.register(_nvml.nvmlShutdown)
+        except Exception:
+            NVML_AVAILABLE = False
+    return NVML_AVAILABLE
+
+
+def _sample_gpu():
+    """Return "name - load%" for the first GPU, or "N/A"."""
+    try:
+        if _ensure_nvml():
+            util = pynvml.nvmlDeviceGetUtilizationRates(_NVML_HANDLE).gpu
+            return f"{_NVML_NAME} - {util:.1f}%"
+        if _ensure_gputil():
+            gpus = GPUtil.getGPUs()
+            if gpus:
+                g = gpus[0]
+                return f"{g.name} - {g.load*100:.1f}%"
+    except Exception:
+        pass
+    return "N/A"
+
+
+def _ensure_matplotlib():
+    global Figure, FigureCanvasTkAgg, np, MATPLOTLIB_AVAILABLE
+    if MATPLOTLIB_AVAILABLE is None:
+        try:
+            import numpy as _np
+            import matplotlib
+            matplotlib.use("TkAgg")
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg as _canvas
+            from matplotlib.figure import Figure as _figure
+            Figure = _figure; FigureCanvasTkAgg = _canvas; np = _np
+            MATPLOTLIB_AVAILABLE = True
+        except Exception:
+            MATPLOTLIB_AVAILABLE = False
+    return MATPLOTLIB_AVAILABLE
 
 # sound backends
-SOUND_BACKENDS = {}
 try:
     import winsound
-    SOUND_BACKENDS["winsound"] = winsound
 except Exception:
     winsound = None
 try:
     import simpleaudio as sa
-    SOUND_BACKENDS["simpleaudio"] = sa
 except Exception:
     sa = None
 
@@ -90,6 +155,14 @@ BTN_ACTIVE = "#bdbdbd"
 FONT = ("MS Sans Serif", 10)
 TITLE_FONT = ("MS Sans Serif", 10, "bold")
 
+# Max items per Listbox.insert() call
+LISTBOX_BATCH = 1000
+
+# Task Manager sampling periods in seconds. CPU % is averaged over its period,
+# so raising it (2-5s) means fewer wakeups but a smoother, laggier graph.
+PERF_POLL_INTERVAL = 1.0
+METRIC_INTERVALS = {"cpu": PERF_POLL_INTERVAL, "ram": 2.0, "net": 2.0, "gpu": 5.0, "disk": 30.0}
+
 # Ensure folders exist
 RECYCLE_DIR.mkdir(parents=True, exist_ok=True)
 if not RECYCLE_INDEX.exists():
@@ -97,24 +170,59 @@ if not RECYCLE_INDEX.exists():
 
 
 # ---------- Helpers ----------
+def _make_winsound_player():
+    if winsound is None:
+        return None
+    flags = winsound.SND_FILENAME | winsound.SND_ASYNC
+    def _play(path):
+        winsound.PlaySound(str(path), flags)
+    return _play
+
+
+def _make_simpleaudio_player():
+    if sa is None:
+        return None
+    waves = {}
+    for p in (STARTUP_WAV, SHUTDOWN_WAV):
+        try:
+            waves[p] = sa.WaveObject.from_wave_file(str(p))
+        except Exception:
+            pass
+    def _play(path):
+        wave_obj = waves.get(path)
+        if wave_obj is None:
+            wave_obj = waves[path] = sa.WaveObject.from_wave_file(str(path))
+        wave_obj.play()
+    return _play
+
+
+# Backend is picked once at import; both backends return immediately.
+_PLAY = _make_winsound_player() or _make_simpleaudio_player() or (lambda path: None)
+
+# One long-lived worker plays queued sounds so opening/closing windows never
+# spawns a thread or touches the disk on the Tk thread.
+_audio_q = queue.Queue()
+_AUDIO_WORKER = None
+
+
+def _audio_worker():
+    while True:
+        path = _audio_q.get()
+        if not path.exists():
+            continue
+        try:
+            _PLAY(path)
+        except Exception:
+            pass
+
+
 def play_sound(path: Path):
     """Non-fatal attempt to play a WAV file asynchronously."""
-    if not path.exists():
-        return
-    try:
-        if "winsound" in SOUND_BACKENDS:
-            SOUND_BACKENDS["winsound"].PlaySound(str(path), SOUND_BACKENDS["winsound"].SND_FILENAME | SOUND_BACKENDS["winsound"].SND_ASYNC)
-            return
-    except Exception:
-        pass
-    try:
-        if "simpleaudio" in SOUND_BACKENDS:
-            wave_obj = SOUND_BACKENDS["simpleaudio"].WaveObject.from_wave_file(str(path))
-            wave_obj.play()
-            return
-    except Exception:
-        pass
-    # fallback: no-op
+    global _AUDIO_WORKER
+    if _AUDIO_WORKER is None:
+        _AUDIO_WORKER = threading.Thread(target=_audio_worker, daemon=True)
+        _AUDIO_WORKER.start()
+    _audio_q.put(path)
 
 
 def format_bytes(n):
@@ -125,23 +233,54 @@ def format_bytes(n):
     return f"{n:.1f}PB"
 
 
+# psutil.net_if_stats()/net_if_addrs() walk every NIC; the 1 Hz status tick and
+# the Control Panel share one snapshot refreshed at most every _NET_CACHE_TTL s.
+_NET_CACHE = {"t": 0.0, "val": (False, None), "stats": None, "addrs": None}
+_NET_CACHE_TTL = 5.0
+
+# Interface-name prefixes ("ethernet" is covered by "eth"; "en" is macOS/systemd)
+_ETH_PREFIXES = ("eth", "en")
+_LOOP_PREFIXES = ("lo",)
+
+
+def _net_cache(force=False):
+    """Return _NET_CACHE, re-querying psutil if the snapshot is stale (or force is set)."""
+    now = time.monotonic()
+    if force or _NET_CACHE["stats"] is None or now - _NET_CACHE["t"] >= _NET_CACHE_TTL:
+        try:
+            stats = psutil.net_if_stats(); addrs = psutil.net_if_addrs()
+        except Exception:
+            stats, addrs = {}, {}
+        _NET_CACHE.update(t=now, val=_detect_ethernet(stats), stats=stats, addrs=addrs)
+    return _NET_CACHE
+
+
+def _get_net_snapshot(force=False):
+    """Return (stats, addrs, t) from the shared NIC snapshot."""
+    cache = _net_cache(force)
+    return cache["stats"], cache["addrs"], cache["t"]
+
+
 def is_ethernet_connected():
     """Return (bool, interface_name_or_None). Heuristic based on interface names / speed."""
+    return _net_cache()["val"]
+
+
+def _detect_ethernet(stats):
     try:
-        stats = psutil.net_if_stats()
         for name, st in stats.items():
             if not st.isup:
                 continue
             lname = name.lower()
-            if lname.startswith("lo") or "loop" in lname:
+            if lname.startswith(_LOOP_PREFIXES):
                 continue
-            if any(x in lname for x in ("eth", "ethernet", "en")):
+            if lname.startswith(_ETH_PREFIXES):
                 return True, name
             if st.speed and st.speed > 0:
                 return True, name
         # fallback
         for name, st in stats.items():
-            if st.isup and not name.lower().startswith("lo"):
+            if st.isup and not name.lower().startswith(_LOOP_PREFIXES):
                 return True, name
     except Exception:
         pass
@@ -149,44 +288,102 @@ def is_ethernet_connected():
 
 
 # ---------- Recycle Bin persistence ----------
+# index.json is read once and kept in memory; a single background writer
+# debounces bursts of saves into one atomic write, and exit flushes the rest.
+_RECYCLE_CACHE = None
+_RECYCLE_DIRTY = False
+_RECYCLE_LOCK = threading.Lock()
+_RECYCLE_TRIGGER = queue.Queue(maxsize=1)
+_RECYCLE_WRITER = None
+_RECYCLE_FLUSH_DELAY = 0.2
+
+
 def load_recycle_index():
-    try:
-        return json.loads(RECYCLE_INDEX.read_text(encoding="utf-8"))
-    except Exception:
-        return {}
+    """Return the shared in-memory recycle index (loaded from disk on first use)."""
+    global _RECYCLE_CACHE
+    if _RECYCLE_CACHE is None:
+        try:
+            _RECYCLE_CACHE = json.loads(RECYCLE_INDEX.read_text(encoding="utf-8"))
+        except Exception:
+            _RECYCLE_CACHE = {}
+    return _RECYCLE_CACHE
+
+
+def _flush():
+    """Write the recycle index to disk if it changed since the last flush."""
+    global _RECYCLE_DIRTY
+    with _RECYCLE_LOCK:
+        if not _RECYCLE_DIRTY:
+            return
+        try:
+            tmp = RECYCLE_INDEX.with_suffix(".tmp")
+            tmp.write_text(json.dumps(_RECYCLE_CACHE, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, RECYCLE_INDEX)
+            _RECYCLE_DIRTY = False
+        except Exception:
+            pass
+
+
+def _recycle_writer():
+    while True:
+        _RECYCLE_TRIGGER.get()
+        time.sleep(_RECYCLE_FLUSH_DELAY)
+        _flush()
 
 
 def save_recycle_index(idx):
+    """Mark the index dirty and wake the background writer."""
+    global _RECYCLE_CACHE, _RECYCLE_DIRTY, _RECYCLE_WRITER
+    with _RECYCLE_LOCK:
+        _RECYCLE_CACHE = idx
+        _RECYCLE_DIRTY = True
+        if _RECYCLE_WRITER is None:
+            _RECYCLE_WRITER = threading.Thread(target=_recycle_writer, daemon=True)
+            _RECYCLE_WRITER.start()
     try:
-        RECYCLE_INDEX.write_text(json.dumps(idx), encoding="utf-8")
-    except Exception:
-        pass
+        _RECYCLE_TRIGGER.put_nowait(None)
+    except queue.Full:
+        pass  # a flush is already pending
+
+
+atexit.register(_flush)
+
+
+def _move_file(src, dst):
+    """Rename src to dst; across volumes copy data and metadata, then remove src."""
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.copy2(src, dst)
+        try:
+            os.remove(src)
+        except Exception:
+            pass
 
 
 def move_to_recycle(path: str):
     """
-    Move a real file into recycle archive (copy bytes into recycle_dir),
-    remove original if possible, and record meta in index.json.
+    Move a real file into recycle archive (rename into recycle_dir, falling
+    back to a copy across volumes) and record meta in index.json.
     Returns key.
     """
     idx = load_recycle_index()
-    name = os.path.basename(path) or "unknown"
+    p = Path(path)
+    name = p.name or "unknown"
+    orig = str(p if p.is_absolute() else Path.cwd() / p)
     timestamp = int(time.time())
     key = f"{timestamp}_{name}"
     target = RECYCLE_DIR / key
     try:
-        if os.path.isfile(path):
-            with open(path, "rb") as src, open(target, "wb") as dst:
-                dst.write(src.read())
-            try:
-                os.remove(path)
-            except Exception:
-                pass
-            idx[key] = {"orig": os.path.abspath(path), "type": "file", "saved": str(target)}
+        if p.is_file():
+            _move_file(path, str(target))
+            idx[key] = {"orig": orig, "type": "file", "saved": str(target)}
         else:
-            idx[key] = {"orig": os.path.abspath(path), "type": "unknown", "saved": None}
+            idx[key] = {"orig": orig, "type": "unknown", "saved": None}
     except Exception:
-        idx[key] = {"orig": os.path.abspath(path), "type": "error", "saved": None}
+        idx[key] = {"orig": orig, "type": "error", "saved": None}
     save_recycle_index(idx)
     return key
 
@@ -201,14 +398,7 @@ def restore_from_recycle(key: str, target_path: str = None):
             saved = Path(entry["saved"])
             dest = Path(target_path) if target_path else Path(entry["orig"])
             dest.parent.mkdir(parents=True, exist_ok=True)
-            with open(saved, "rb") as s, open(dest, "wb") as d:
-                d.write(s.read())
-        # remove saved file if exists
-        if entry.get("saved"):
-            try:
-                Path(entry["saved"]).unlink()
-            except Exception:
-                pass
+            _move_file(str(saved), str(dest))
         idx.pop(key, None)
         save_recycle_index(idx)
         return True, "Restored"
@@ -224,7 +414,8 @@ def empty_recycle():
                 Path(v["saved"]).unlink()
             except Exception:
                 pass
-    save_recycle_index({})
+    idx.clear()
+    save_recycle_index(idx)
     return True
 
 
@@ -246,11 +437,15 @@ class BootSplash(tk.Toplevel):
         self.after(50, self._start)
 
     def _start(self):
-        threading.Thread(target=play_sound, args=(STARTUP_WAV,), daemon=True).start()
-        for i in range(101):
-            self.progress['value'] = i
-            self.update_idletasks()
-            time.sleep(0.015 + i * 0.0002)
+        play_sound(STARTUP_WAV)
+        self.after(0, self._tick)
+
+    def _tick(self, i=0):
+        # driven by after() so the event loop stays live while the bar fills
+        self.progress['value'] = i
+        if i < 100:
+            self.after(int(15 + i * 0.2), self._tick, i + 1)
+            return
         self.destroy()
         if callable(self.on_done):
             self.on_done()
@@ -271,19 +466,47 @@ class ShutdownSplash(tk.Toplevel):
         self.after(50, self._start)
 
     def _start(self):
-        threading.Thread(target=play_sound, args=(SHUTDOWN_WAV,), daemon=True).start()
-        for i in range(50):
-            time.sleep(0.02)
-            self.update_idletasks()
+        play_sound(SHUTDOWN_WAV)
+        self.after(1000, self._finish)
+
+    def _finish(self):
         self.destroy()
         if callable(self.on_done):
             self.on_done()
 
 
 # ---------- Desktop shell ----------
+# (label, CinnaDesktop method name)
+_ICON_SPECS = (
+    ("My Computer", "open_my_computer"),
+    ("File Explorer", "open_file_explorer"),
+    ("Notepad", "open_notepad"),
+    ("Paint", "open_paint"),
+    ("Calculator", "open_calculator"),
+    ("Control Panel", "open_control_panel"),
+    ("Task Manager", "open_task_manager"),
+    ("Recycle Bin", "open_recycle_bin"),
+)
+
+_START_MENU_SPECS = (
+    ("Task Manager", "open_task_manager"),
+    ("Control Panel", "open_control_panel"),
+    ("File Explorer", "open_file_explorer"),
+    ("Notepad", "open_notepad"),
+    ("Paint", "open_paint"),
+    ("Calculator", "open_calculator"),
+    ("Shutdown", "request_shutdown"),
+)
+
+
 class CinnaDesktop(tk.Tk):
     def __init__(self):
         super().__init__()
+        # panel colour for app windows comes from Tk's option database rather
+        # than a bg= kwarg on every Toplevel/Frame/Label
+        self.option_add("*Toplevel.Background", WIN98_PANEL)
+        self.option_add("*Frame.Background", WIN98_PANEL)
+        self.option_add("*Label.Background", WIN98_PANEL)
         self.title("CinnaOS - Windows 98 Edition")
         self.geometry(f"{WINDOW_W}x{WINDOW_H}")
         self.configure(bg=THEME_BG)
@@ -292,8 +515,10 @@ class CinnaDesktop(tk.Tk):
         self.task_buttons = []
         self.desktop_icons = []
         self.start_menu = None
+        self._last_eth = None
+        self._last_clock = None
         self._create_ui()
-        self.after(1000, self._update_status)
+        self._status_after = self.after(1000, self._update_status)
         self.center_window()
 
     def center_window(self):
@@ -317,35 +542,29 @@ class CinnaDesktop(tk.Tk):
         self.eth_label.pack(side="right", padx=6)
         self.clock_label = tk.Label(self.status_frame, text="", bg=WIN98_PANEL, font=("Consolas", 9))
         self.clock_label.pack(side="right", padx=6)
-        self.desktop_frame.bind("<Button-3>", self._desktop_right_click)
+        self.canvas.bind("<Button-3>", self._desktop_right_click)
 
     def _create_icons(self):
-        icons = [
-            ("My Computer", self.open_my_computer),
-            ("File Explorer", self.open_file_explorer),
-            ("Notepad", self.open_notepad),
-            ("Paint", self.open_paint),
-            ("Calculator", self.open_calculator),
-            ("Control Panel", self.open_control_panel),
-            ("Task Manager", self.open_task_manager),
-            ("Recycle Bin", self.open_recycle_bin),
-        ]
+        # all icons are items on one canvas rather than a Frame/Label/Button each
+        self.canvas = tk.Canvas(self.desktop_frame, bg=THEME_BG, highlightthickness=0)
+        self.canvas.pack(fill="both", expand=True)
         x = 20; y = 20
-        for name, cmd in icons:
-            frame = tk.Frame(self.desktop_frame, width=96, height=96, bg=THEME_BG)
-            frame.place(x=x, y=y)
-            icon_lbl = tk.Label(frame, text="🗋", bg=THEME_BG, font=("Segoe UI", 22))
-            icon_lbl.pack()
-            btn = tk.Button(frame, text=name, bg=THEME_BG, relief="flat", command=cmd)
-            btn.pack()
-            btn.bind("<Button-3>", lambda e, nm=name, fn=cmd: self._icon_context_menu(e, nm, fn))
-            btn.bind("<Double-Button-1>", lambda e, fn=cmd: fn())
-            self.desktop_icons.append((frame, name))
+        for name, method in _ICON_SPECS:
+            cmd = getattr(self, method)
+            tag = "ic_" + name.replace(" ", "_")
+            cx = x + 48
+            self.canvas.create_text(cx, y + 20, text="🗋", font=("Segoe UI", 22), tags=("icon", tag))
+            self.canvas.create_text(cx, y + 60, text=name, font=FONT, width=96, tags=("icon", tag))
+            self.canvas.tag_bind(tag, "<Button-3>", lambda e, nm=name, fn=cmd: self._icon_context_menu(e, nm, fn))
+            self.canvas.tag_bind(tag, "<Double-Button-1>", lambda e, fn=cmd: fn())
+            self.desktop_icons.append((tag, name))
             y += 100
             if y > WINDOW_H - 200:
                 y = 20; x += 110
 
     def _desktop_right_click(self, ev):
+        if "icon" in self.canvas.gettags("current"):
+            return  # handled by the icon's own binding
         menu = tk.Menu(self, tearoff=0)
         menu.add_command(label="New -> Folder", command=lambda: self._create_new_folder())
         menu.add_command(label="Refresh", command=lambda: None)
@@ -388,44 +607,42 @@ class CinnaDesktop(tk.Tk):
         w.geometry(f"220x280+{bx}+{by}")
         tk.Label(w, text="CinnaOS Programs", bg=WIN98_PANEL, font=TITLE_FONT).pack(fill="x", padx=6, pady=6)
         frame = tk.Frame(w, bg=WIN98_PANEL); frame.pack(fill="both", expand=True)
-        programs = [
-            ("Task Manager", self.open_task_manager),
-            ("Control Panel", self.open_control_panel),
-            ("File Explorer", self.open_file_explorer),
-            ("Notepad", self.open_notepad),
-            ("Paint", self.open_paint),
-            ("Calculator", self.open_calculator),
-            ("Shutdown", self.request_shutdown),
-        ]
-        for pname, pfunc in programs:
-            b = tk.Button(frame, text=pname, bg=BTN_BG, relief="raised", command=lambda f=pfunc, w=w: (f(), w.destroy()))
+        for pname, method in _START_MENU_SPECS:
+            b = tk.Button(frame, text=pname, bg=BTN_BG, relief="raised", command=self._make_start_cmd(getattr(self, method), w))
             b.pack(fill="x", padx=6, pady=4)
         self.start_menu = w
 
+    def _make_start_cmd(self, f, w):
+        return lambda: (f(), w.destroy())
+
     def add_task_button(self, title, winref):
-        for t, ref in self.task_buttons:
+        for t, ref, btn in self.task_buttons:
             if t == title: return
         b = tk.Button(self.taskframe, text=title, bg=BTN_BG, relief="raised", command=lambda r=winref: r.lift())
         b.pack(side="left", padx=2)
-        self.task_buttons.append((title, winref))
+        self.task_buttons.append((title, winref, b))
 
     def remove_task_button(self, title):
-        for i, (t, ref) in enumerate(list(self.task_buttons)):
+        for i, (t, ref, btn) in enumerate(self.task_buttons):
             if t == title:
+                btn.destroy()
                 self.task_buttons.pop(i)
                 break
-        for child in self.taskframe.winfo_children():
-            child.destroy()
-        for t, ref in self.task_buttons:
-            b = tk.Button(self.taskframe, text=t, bg=BTN_BG, relief="raised", command=lambda r=ref: r.lift())
-            b.pack(side="left", padx=2)
 
     def _update_status(self):
+        if self._stop or not self.winfo_exists():
+            return
         eth, name = is_ethernet_connected()
-        self.eth_label.config(text=f"Ethernet: {'Yes ('+name+')' if eth else 'No'}")
-        self.clock_label.config(text=time.strftime("%Y-%m-%d %H:%M:%S"))
-        if not self._stop:
-            self.after(1000, self._update_status)
+        eth_text = f"Ethernet: {'Yes ('+name+')' if eth else 'No'}"
+        if eth_text != self._last_eth:
+            self.eth_label.config(text=eth_text); self._last_eth = eth_text
+        clock = time.strftime("%Y-%m-%d %H:%M:%S")
+        if clock != self._last_clock:
+            self.clock_label.config(text=clock); self._last_clock = clock
+        # wake just after the next wall-clock second so the clock never skips one;
+        # a late tick simply waits for the following boundary instead of piling up
+        delay = 1000 - int(time.time() % 1 * 1000) + 5
+        self._status_after = self.after(delay, self._update_status)
 
     # App openers
     def open_notepad(self):
@@ -470,15 +687,16 @@ class CinnaDesktop(tk.Tk):
 
     def request_shutdown(self):
         if messagebox.askyesno("Shutdown", "Are you sure you want to shut down CinnaOS?"):
-            def _do():
-                s = ShutdownSplash(self)
-                time.sleep(1.2)
-                try:
-                    self._stop = True
-                    self.destroy()
-                except Exception:
-                    os._exit(0)
-            threading.Thread(target=_do, daemon=True).start()
+            self._stop = True
+            self.after_cancel(self._status_after)
+            ShutdownSplash(self, on_done=self._finish_shutdown)
+
+    def _finish_shutdown(self):
+        try:
+            self.destroy()
+        except Exception:
+            _flush()  # os._exit skips atexit, so write the recycle index now
+            os._exit(0)
 
 
 # ---------- Generic App Window ----------
@@ -488,14 +706,13 @@ class AppWindow(tk.Toplevel):
         self.parent = parent
         self.title(title)
         self.geometry(f"{w}x{h}")
-        self.configure(bg=WIN98_PANEL)
         self.protocol("WM_DELETE_WINDOW", self._on_close)
-        self.content = tk.Frame(self, bg=WIN98_PANEL)
+        self.content = tk.Frame(self)
         self.content.pack(fill="both", expand=True)
-        threading.Thread(target=play_sound, args=(STARTUP_WAV,), daemon=True).start()
+        play_sound(STARTUP_WAV)
 
     def _on_close(self):
-        threading.Thread(target=play_sound, args=(SHUTDOWN_WAV,), daemon=True).start()
+        play_sound(SHUTDOWN_WAV)
         try:
             self.destroy()
         except Exception:
@@ -520,7 +737,14 @@ class NotepadApp:
         if p:
             try:
                 with open(p, "r", encoding="utf-8", errors="ignore") as f:
-                    self.text.delete("1.0", "end"); self.text.insert("1.0", f.read())
+                    self.text.delete("1.0", "end")
+                    # insert in 64K chunks so large files don't block the UI in one Tcl call
+                    while True:
+                        buf = f.read(65536)
+                        if not buf:
+                            break
+                        self.text.insert("end", buf)
+                        self.text.update_idletasks()
                 self.current = p
                 self.win.title(f"Notepad - {os.path.basename(p)}")
             except Exception as e:
@@ -529,8 +753,7 @@ class NotepadApp:
     def save_file(self):
         if self.current:
             try:
-                with open(self.current, "w", encoding="utf-8") as f:
-                    f.write(self.text.get("1.0", "end"))
+                self._write(self.current)
                 messagebox.showinfo("Saved", "Saved.")
             except Exception as e:
                 messagebox.showerror("Save", str(e))
@@ -541,13 +764,17 @@ class NotepadApp:
         p = filedialog.asksaveasfilename(defaultextension=".txt")
         if p:
             try:
-                with open(p, "w", encoding="utf-8") as f:
-                    f.write(self.text.get("1.0", "end"))
+                self._write(p)
                 self.current = p
                 self.win.title(f"Notepad - {os.path.basename(p)}")
             except Exception as e:
                 messagebox.showerror("Save", str(e))
 
+    def _write(self, p):
+        # "end-1c" drops the trailing newline Tk always keeps at the end of a Text
+        with open(p, "w", encoding="utf-8", buffering=1 << 20) as f:
+            f.write(self.text.get("1.0", "end-1c"))
+
 
 # ---------- Paint ----------
 class PaintApp:
@@ -562,15 +789,44 @@ class PaintApp:
         tk.Button(tb, text="Clear", command=self.clear, bg=BTN_BG).pack(side="left", padx=6)
         self.canvas = tk.Canvas(win.content, bg="white", cursor="cross")
         self.canvas.pack(fill="both", expand=True, padx=6, pady=(0,6))
+        self._pts = []
+        self._flush_after = None
+        self.canvas.bind("<ButtonPress-1>", self.start_stroke)
         self.canvas.bind("<B1-Motion>", self.paint)
+        self.canvas.bind("<ButtonRelease-1>", self.end_stroke)
 
     def choose_color(self):
         c = colorchooser.askcolor()[1]
         if c: self.color = c
 
+    def start_stroke(self, e):
+        self._pts = [(e.x, e.y)]
+
     def paint(self, e):
-        r = int(self.brush.get()); x, y = e.x, e.y
-        self.canvas.create_oval(x-r, y-r, x+r, y+r, fill=self.color, outline=self.color)
+        # buffer motion points and emit one smoothed line item per 8 points;
+        # a short timer flushes the rest so slow strokes don't lag the cursor
+        self._pts.append((e.x, e.y))
+        if len(self._pts) >= 8:
+            self._flush_stroke()
+        else:
+            if self._flush_after is not None:
+                self.canvas.after_cancel(self._flush_after)
+            self._flush_after = self.canvas.after(30, self._flush_stroke)
+
+    def end_stroke(self, e):
+        self._flush_stroke()
+        self._pts = []
+
+    def _flush_stroke(self):
+        if self._flush_after is not None:
+            self.canvas.after_cancel(self._flush_after)
+            self._flush_after = None
+        if len(self._pts) < 2:
+            return
+        r = int(self.brush.get())
+        flat = [c for pt in self._pts for c in pt]
+        self.canvas.create_line(*flat, width=2*r, fill=self.color, capstyle="round", joinstyle="round", smooth=True)
+        self._pts = [self._pts[-1]]
 
     def save(self):
         p = filedialog.asksaveasfilename(defaultextension=".ps")
@@ -595,26 +851,29 @@ class FileExplorerApp:
         self.listbox = tk.Listbox(win.content)
         self.listbox.pack(fill="both", expand=True, padx=6, pady=(0,6))
         self.listbox.bind("<Double-Button-1>", self.open_item)
+        self._cwd = Path(self.path_var.get())
         self.refresh()
 
     def refresh(self):
         p = self.path_var.get()
         try:
-            items = os.listdir(p)
+            with os.scandir(p) as it:
+                names = sorted((e.name for e in it), key=str.lower)
+            self._cwd = Path(p)
             self.listbox.delete(0, "end"); self.listbox.insert("end", "..")
-            for it in items:
-                self.listbox.insert("end", it)
+            # one Tcl call per batch; batches keep the command string bounded
+            for i in range(0, len(names), LISTBOX_BATCH):
+                self.listbox.insert("end", *names[i:i + LISTBOX_BATCH])
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
     def open_item(self, ev):
         sel = self.listbox.get(self.listbox.curselection())
-        p = self.path_var.get()
         if sel == "..":
-            parent = os.path.dirname(p); self.path_var.set(parent or "/"); self.refresh(); return
-        new = os.path.join(p, sel)
-        if os.path.isdir(new):
-            self.path_var.set(new); self.refresh()
+            self.path_var.set(str(self._cwd.parent)); self.refresh(); return
+        new = self._cwd / sel
+        if new.is_dir():
+            self.path_var.set(str(new)); self.refresh()
         else:
             try:
                 if sys.platform.startswith("win"):
@@ -627,6 +886,50 @@ class FileExplorerApp:
 
 
 # ---------- Calculator ----------
+_CALC_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Constant,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow,
+    ast.USub, ast.UAdd,
+)
+
+
+# Largest integer power result the calculator will compute, in bits
+CALC_MAX_POW_BITS = 100_000
+
+
+def _eval_node(node):
+    expr = ast.fix_missing_locations(ast.Expression(node))
+    return eval(compile(expr, "<calc>", "eval"), {"__builtins__": {}}, {})
+
+
+def _validate(tree):
+    """Reject anything but plain arithmetic on numeric literals."""
+    nodes = list(ast.walk(tree))
+    for node in nodes:
+        if not isinstance(node, _CALC_NODES):
+            raise ValueError(f"unsupported expression: {type(node).__name__}")
+        if isinstance(node, ast.Constant) and (
+                isinstance(node.value, bool) or not isinstance(node.value, (int, float))):
+            raise ValueError("only numbers are allowed")
+    # a huge power (e.g. 9**9**9) would hang the Tk thread: bound the result size.
+    # walk() is breadth-first, so reversed() checks inner powers before outer ones
+    for node in reversed(nodes):
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Pow):
+            if any(isinstance(n, ast.Pow) for n in ast.walk(node.left)):
+                raise ValueError("nested powers are not allowed")  # (2**1000)**1000**...
+            base, exp = _eval_node(node.left), _eval_node(node.right)
+            if isinstance(base, int) and isinstance(exp, int) and \
+                    abs(base).bit_length() * abs(exp) > CALC_MAX_POW_BITS:
+                raise ValueError("result too large")
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_expr(s):
+    tree = ast.parse(s, mode="eval")
+    _validate(tree)
+    return compile(tree, "<calc>", "eval")
+
+
 class CalculatorApp:
     def __init__(self, win: AppWindow):
         self.win = win
@@ -647,7 +950,7 @@ class CalculatorApp:
     def on_press(self, ch):
         if ch == "=":
             try:
-                val = eval(self.entry.get())
+                val = eval(_compile_expr(self.entry.get()), {"__builtins__": {}}, {})
                 self.entry.delete(0, "end"); self.entry.insert("end", str(val))
             except Exception:
                 self.entry.delete(0, "end"); self.entry.insert("end", "Error")
@@ -667,10 +970,11 @@ class RecycleBinApp:
         self.refresh()
 
     def refresh(self):
-        self.listbox.delete(0, "end")
         idx = load_recycle_index()
-        for k, v in idx.items():
-            self.listbox.insert("end", f"{k} — {v.get('orig')}")
+        lines = [f"{k} — {v.get('orig')}" for k, v in sorted(idx.items())]
+        self.listbox.delete(0, "end")
+        if lines:
+            self.listbox.insert("end", *lines)
 
     def empty_bin(self):
         if messagebox.askyesno("Empty", "Permanently delete all items?"):
@@ -696,168 +1000,438 @@ class ControlPanelApp:
         self.win = win
         left = tk.Frame(win.content, bg=WIN98_PANEL); left.pack(side="left", fill="y", padx=6, pady=6)
         right = tk.Frame(win.content, bg=WIN98_PANEL); right.pack(side="left", fill="both", expand=True, padx=6, pady=6)
-        tk.Button(left, text="System Info", bg=BTN_BG, command=lambda: self.show_info(right)).pack(fill="x", pady=4)
-        tk.Button(left, text="Appearance", bg=BTN_BG, command=lambda: self.show_appearance(right)).pack(fill="x", pady=4)
-        tk.Button(left, text="Network", bg=BTN_BG, command=lambda: self.show_network(right)).pack(fill="x", pady=4)
-        tk.Button(left, text="About", bg=BTN_BG, command=lambda: self.show_about(right)).pack(fill="x", pady=4)
-        self.show_info(right)
-
-    def clear(self, right):
-        for c in right.winfo_children(): c.destroy()
-
-    def show_info(self, right):
-        self.clear(right)
-        tk.Label(right, text="System Information", bg=WIN98_PANEL, font=TITLE_FONT).pack(anchor="w")
-        tk.Label(right, text=f"Platform: {sys.platform}", bg=WIN98_PANEL).pack(anchor="w")
-        tk.Label(right, text=f"CPU cores (logical): {psutil.cpu_count()}", bg=WIN98_PANEL).pack(anchor="w")
-        tk.Label(right, text=f"Total RAM: {format_bytes(psutil.virtual_memory().total)}", bg=WIN98_PANEL).pack(anchor="w")
-        if GPUtil_available:
+        tk.Button(left, text="System Info", bg=BTN_BG, command=self.show_info).pack(fill="x", pady=4)
+        tk.Button(left, text="Appearance", bg=BTN_BG, command=self.show_appearance).pack(fill="x", pady=4)
+        tk.Button(left, text="Network", bg=BTN_BG, command=self.show_network).pack(fill="x", pady=4)
+        tk.Button(left, text="About", bg=BTN_BG, command=self.show_about).pack(fill="x", pady=4)
+        # each pane is built once; switching just swaps which frame is packed
+        self._panes = {}
+        for key, build in (("info", self._build_info), ("appearance", self._build_appearance),
+                           ("network", self._build_network), ("about", self._build_about)):
+            pane = tk.Frame(right, bg=WIN98_PANEL)
+            build(pane)
+            self._panes[key] = pane
+        self._current = None
+        self.show_info()
+
+    def _show(self, key):
+        if self._current is not None:
+            self._current.pack_forget()
+        self._current = self._panes[key]
+        self._current.pack(fill="both", expand=True)
+
+    def show_info(self): self._show("info")
+
+    def show_appearance(self): self._show("appearance")
+
+    def show_network(self): self._show("network")
+
+    def show_about(self): self._show("about")
+
+    def _build_info(self, pane):
+        tk.Label(pane, text="System Information", bg=WIN98_PANEL, font=TITLE_FONT).pack(anchor="w")
+        tk.Label(pane, text=f"Platform: {sys.platform}", bg=WIN98_PANEL).pack(anchor="w")
+        tk.Label(pane, text=f"CPU cores (logical): {psutil.cpu_count()}", bg=WIN98_PANEL).pack(anchor="w")
+        tk.Label(pane, text=f"Total RAM: {format_bytes(psutil.virtual_memory().total)}", bg=WIN98_PANEL).pack(anchor="w")
+        if _ensure_gputil():
             try:
                 gpus = GPUtil.getGPUs()
                 for g in gpus:
-                    tk.Label(right, text=f"GPU: {g.name}", bg=WIN98_PANEL).pack(anchor="w")
+                    tk.Label(pane, text=f"GPU: {g.name}", bg=WIN98_PANEL).pack(anchor="w")
             except Exception:
                 pass
 
-    def show_appearance(self, right):
-        self.clear(right)
-        tk.Label(right, text="Appearance", bg=WIN98_PANEL, font=TITLE_FONT).pack(anchor="w")
-        tk.Button(right, text="Choose Background Color", bg=BTN_BG, command=self.pick_bg).pack(anchor="w", pady=6)
+    def _build_appearance(self, pane):
+        tk.Label(pane, text="Appearance", bg=WIN98_PANEL, font=TITLE_FONT).pack(anchor="w")
+        tk.Button(pane, text="Choose Background Color", bg=BTN_BG, command=self.pick_bg).pack(anchor="w", pady=6)
 
     def pick_bg(self):
         c = colorchooser.askcolor()[1]
         if c:
             self.win.master.desktop_frame.configure(bg=c)
-
-    def show_network(self, right):
-        self.clear(right)
-        tk.Label(right, text="Network Interfaces", bg=WIN98_PANEL, font=TITLE_FONT).pack(anchor="w")
-        stats = psutil.net_if_stats(); addrs = psutil.net_if_addrs()
+            self.win.master.canvas.configure(bg=c)
+
+    def _build_network(self, pane):
+        tk.Label(pane, text="Network Interfaces", bg=WIN98_PANEL, font=TITLE_FONT).pack(anchor="w")
+        tk.Button(pane, text="Refresh", bg=BTN_BG, command=lambda: self._fill_network(force=True)).pack(anchor="w", pady=4)
+        # one Text widget for every NIC instead of a Label per line
+        self.net_text = tk.Text(pane, wrap="none", bg=WIN98_PANEL, relief="flat", font=FONT)
+        self.net_text.pack(anchor="w", fill="both", expand=True)
+        self._fill_network()
+
+    def _fill_network(self, force=False):
+        stats, addrs, _ = _get_net_snapshot(force)
+        lines = []
         for name, st in stats.items():
-            tk.Label(right, text=f"{name} - {'up' if st.isup else 'down'} - {st.speed} Mbps", bg=WIN98_PANEL).pack(anchor="w")
-            if name in addrs:
-                for a in addrs[name]:
-                    tk.Label(right, text=f"   {a.family.name}: {a.address}", bg=WIN98_PANEL).pack(anchor="w")
-
-    def show_about(self, right):
-        self.clear(right)
-        tk.Label(right, text="About CinnaOS", bg=WIN98_PANEL, font=TITLE_FONT).pack(anchor="w")
-        tk.Label(right, text="CinnaOS - Windows98 Retro (Python/Tkinter)", bg=WIN98_PANEL).pack(anchor="w")
-        tk.Label(right, text=f"Startup sound: {STARTUP_WAV}", bg=WIN98_PANEL).pack(anchor="w")
-        tk.Label(right, text=f"Shutdown sound: {SHUTDOWN_WAV}", bg=WIN98_PANEL).pack(anchor="w")
+            lines.append(f"{name} - {'up' if st.isup else 'down'} - {st.speed} Mbps")
+            for a in addrs.get(name, ()):
+                lines.append(f"   {a.family.name}: {a.address}")
+        self.net_text.configure(state="normal", height=max(len(lines), 1))
+        self.net_text.delete("1.0", "end")
+        self.net_text.insert("1.0", "\n".join(lines))
+        self.net_text.configure(state="disabled")
+
+    def _build_about(self, pane):
+        tk.Label(pane, text="About CinnaOS", bg=WIN98_PANEL, font=TITLE_FONT).pack(anchor="w")
+        tk.Label(pane, text="CinnaOS - Windows98 Retro (Python/Tkinter)", bg=WIN98_PANEL).pack(anchor="w")
+        tk.Label(pane, text=f"Startup sound: {STARTUP_WAV}", bg=WIN98_PANEL).pack(anchor="w")
+        tk.Label(pane, text=f"Shutdown sound: {SHUTDOWN_WAV}", bg=WIN98_PANEL).pack(anchor="w")
+
+
+# ---------- Metric sampling ----------
+class MetricBus:
+    """
+    One daemon thread sampling metrics, each at its own interval.
+    Subscribers get a dict of the latest values after every pass that
+    refreshed something; the thread exits when the last one unsubscribes.
+    """
+    def __init__(self):
+        self.metrics = {}  # name -> [interval, last_ts, last_val, sampler_fn]
+        self._subs = []
+        self._lock = threading.Lock()
+        self._thread = None
+        self._wake = threading.Event()  # cuts the wait short when subscribers leave
+
+    def add(self, name, interval, fn, initial=None):
+        self.metrics[name] = [interval, 0.0, initial, fn]
+
+    def values(self):
+        return {name: m[2] for name, m in self.metrics.items()}
+
+    def subscribe(self, cb):
+        with self._lock:
+            self._subs.append(cb)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def unsubscribe(self, cb):
+        with self._lock:
+            if cb in self._subs:
+                self._subs.remove(cb)
+            if not self._subs:
+                self._wake.set()
+
+    def _run(self):
+        # hot loop: bind attribute lookups to locals once
+        monotonic = time.monotonic
+        wait = self._wake.wait
+        metrics = list(self.metrics.values())
+        while True:
+            with self._lock:
+                if not self._subs:
+                    self._thread = None
+                    return
+                subs = list(self._subs)
+                self._wake.clear()
+            now = monotonic()
+            changed = False
+            for m in metrics:
+                if now - m[1] >= m[0]:
+                    try:
+                        m[2] = m[3]()
+                    except Exception:
+                        pass
+                    m[1] = now
+                    changed = True
+            if changed:
+                vals = self.values()
+                for cb in subs:
+                    try:
+                        cb(vals)
+                    except Exception:
+                        pass
+            next_due = min(m[1] + m[0] for m in metrics)
+            wait(max(next_due - monotonic(), 0.05))
+
+
+def _net_rate_sampler():
+    """Return a sampler giving (up, down) in KB/s since its previous call."""
+    netio = psutil.net_io_counters; monotonic = time.monotonic
+    prev = [netio(), monotonic()]
+    def sample():
+        net = netio(); now = monotonic()
+        last, t = prev
+        dt = (now - t) or 1.0
+        up = (net.bytes_sent - last.bytes_sent) / 1024.0 / dt
+        down = (net.bytes_recv - last.bytes_recv) / 1024.0 / dt
+        prev[0], prev[1] = net, now
+        return up, down
+    return sample
+
+
+_METRIC_BUS = None
+
+
+def _get_metric_bus():
+    """Return the MetricBus shared by all Task Manager windows."""
+    global _METRIC_BUS
+    if _METRIC_BUS is None:
+        psutil.cpu_percent(interval=None)  # prime; the next call measures since now
+        bus = MetricBus()
+        iv = METRIC_INTERVALS
+        # psutil functions are bound as defaults so samplers skip the module lookup
+        bus.add("cpu", iv["cpu"], functools.partial(psutil.cpu_percent, interval=None), 0.0)
+        bus.add("ram", iv["ram"], lambda vmem=psutil.virtual_memory: vmem().percent, 0.0)
+        bus.add("disk", iv["disk"], lambda disk=psutil.disk_usage: disk('/').percent, 0.0)
+        bus.add("net", iv["net"], _net_rate_sampler(), (0.0, 0.0))
+        bus.add("gpu", iv["gpu"], _sample_gpu, "N/A")
+        # first CPU reading after one full period rather than immediately
+        bus.metrics["cpu"][1] = time.monotonic()
+        _METRIC_BUS = bus
+    return _METRIC_BUS
 
 
 # ---------- Task Manager ----------
 class TaskManagerApp:
     def __init__(self, win: AppWindow):
         self.win = win
-        top = tk.Frame(win.content, bg=WIN98_PANEL); top.pack(fill="x", padx=6, pady=6)
+        top = tk.Frame(win.content); top.pack(fill="x", padx=6, pady=6)
         tk.Button(top, text="Performance", bg=BTN_BG, command=self.show_perf).pack(side="left", padx=4)
         tk.Button(top, text="Network", bg=BTN_BG, command=self.show_net).pack(side="left", padx=4)
-        self.body = tk.Frame(win.content, bg=WIN98_PANEL); self.body.pack(fill="both", expand=True, padx=6, pady=(0,6))
-        self.prev_net = psutil.net_io_counters()
-        self._running = True
+        self.body = tk.Frame(win.content); self.body.pack(fill="both", expand=True, padx=6, pady=(0,6))
+        # the shared sampler only publishes the latest sample; the UI thread polls it
+        self.q = queue.Queue(maxsize=1)
+        self._last = {}
+        self._perf_visible = False
+        # both tabs are built once and swapped with pack/pack_forget
+        self.perf_frame = tk.Frame(self.body)
+        self.net_frame = tk.Frame(self.body)
+        self._build_perf()
+        self._build_net()
         self.show_perf()
-        threading.Thread(target=self._loop, daemon=True).start()
+        self._bus = _get_metric_bus()
+        self._bus.subscribe(self._publish)
+        self.win.bind("<Destroy>", self._on_destroy, add="+")
+        self._pump_after = self.win.after(250, self._pump)
+
+    def _on_destroy(self, ev):
+        if ev.widget is self.win:
+            self._bus.unsubscribe(self._publish)
+            self.win.after_cancel(self._pump_after)
+
+    def _build_perf(self):
+        f = self.perf_frame
+        self.cpu_label = tk.Label(f, text="CPU: -- %"); self.cpu_label.pack(anchor="w", pady=4)
+        self.ram_label = tk.Label(f, text="RAM: -- %"); self.ram_label.pack(anchor="w", pady=4)
+        self.disk_label = tk.Label(f, text="Disk: -- %"); self.disk_label.pack(anchor="w", pady=4)
+        self.gpu_label = tk.Label(f, text="GPU: N/A"); self.gpu_label.pack(anchor="w", pady=4)
+        self.net_label = tk.Label(f, text="Net: --"); self.net_label.pack(anchor="w", pady=4)
+        self.canvas = None  # matplotlib figure is created on first show_perf()
+        if not _ensure_matplotlib():
+            self.cpu_bar = ttk.Progressbar(f, length=300)
+            self.cpu_bar.pack(pady=4)
+            self.ram_bar = ttk.Progressbar(f, length=300)
+            self.ram_bar.pack(pady=4)
+
+    def _build_figure(self):
+        self.fig = Figure(figsize=(5, 2), dpi=100)
+        self.ax = self.fig.add_subplot(111)
+        self.ax.set_ylim(0, 100)
+        self.ax.set_xlim(0, 60)
+        self.ax.set_title("CPU usage (last 60s)")
+        # CPU history is a float32 ring buffer; x data is fixed and set once
+        self._xs = np.arange(60)
+        self._ys = np.zeros(60, dtype=np.float32)
+        self._cursor = 0
+        # the line is blitted over a cached background; only full redraws repaint the axes
+        self.line, = self.ax.plot(self._xs, self._ys, animated=True)
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self.perf_frame)
+        self.canvas.get_tk_widget().pack(fill="both", expand=True)
+        self._bg = None
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+        self.canvas.mpl_connect("resize_event", lambda e: self.canvas.draw_idle())
+
+    def _build_net(self):
+        tk.Label(self.net_frame, text="Network Interfaces and rates").pack(anchor="w")
+        self.net_list = tk.Listbox(self.net_frame)
+        self.net_list.pack(fill="both", expand=True)
+        self._prev_items = None
 
     def show_perf(self):
-        for c in self.body.winfo_children(): c.destroy()
-        self.cpu_label = tk.Label(self.body, text="CPU: -- %", bg=WIN98_PANEL); self.cpu_label.pack(anchor="w", pady=4)
-        self.ram_label = tk.Label(self.body, text="RAM: -- %", bg=WIN98_PANEL); self.ram_label.pack(anchor="w", pady=4)
-        self.disk_label = tk.Label(self.body, text="Disk: -- %", bg=WIN98_PANEL); self.disk_label.pack(anchor="w", pady=4)
-        self.gpu_label = tk.Label(self.body, text="GPU: N/A", bg=WIN98_PANEL); self.gpu_label.pack(anchor="w", pady=4)
+        self.net_frame.pack_forget()
+        self.perf_frame.pack(fill="both", expand=True)
+        self._perf_visible = True
         if MATPLOTLIB_AVAILABLE:
-            self.fig = Figure(figsize=(5, 2), dpi=100)
-            self.ax = self.fig.add_subplot(111)
-            self.ax.set_ylim(0, 100)
-            self.ax.set_title("CPU usage (last 60s)")
-            self.line, = self.ax.plot([], [])
-            self.canvas = FigureCanvasTkAgg(self.fig, master=self.body)
-            self.canvas.get_tk_widget().pack(fill="both", expand=True)
-            self.cpu_history = [0] * 60
-        else:
-            self.cpu_bar = ttk.Progressbar(self.body, length=300)
-            self.cpu_bar.pack(pady=4)
-            self.ram_bar = ttk.Progressbar(self.body, length=300)
-            self.ram_bar.pack(pady=4)
+            if self.canvas is None:
+                self._build_figure()
+            self.line.set_ydata(self._history())
+            self.canvas.draw_idle()
+
+    def _history(self):
+        """Ring buffer unrolled oldest-first."""
+        return np.concatenate((self._ys[self._cursor:], self._ys[:self._cursor]))
+
+    def _on_draw(self, event):
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self.line)
+
+    def _blit(self):
+        if self._bg is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._bg)
+        self.ax.draw_artist(self.line)
+        self.canvas.blit(self.ax.bbox)
 
     def show_net(self):
-        for c in self.body.winfo_children(): c.destroy()
-        tk.Label(self.body, text="Network Interfaces and rates", bg=WIN98_PANEL).pack(anchor="w")
-        self.net_list = tk.Listbox(self.body)
-        self.net_list.pack(fill="both", expand=True)
+        # while hidden the perf tab is not updated at all
+        self._perf_visible = False
+        self.perf_frame.pack_forget()
+        self.net_frame.pack(fill="both", expand=True)
         self._populate_net()
 
     def _populate_net(self):
-        self.net_list.delete(0, "end")
-        stats = psutil.net_if_stats(); addrs = psutil.net_if_addrs()
+        stats, addrs, _ = _get_net_snapshot()
+        items = []
         for name, st in stats.items():
-            self.net_list.insert("end", f"{name}: {'up' if st.isup else 'down'} - speed {st.speed}")
-            if name in addrs:
-                for a in addrs[name]:
-                    self.net_list.insert("end", f"   {a.family.name} {a.address}")
-
-    def _loop(self):
-        while self._running:
+            items.append(f"{name}: {'up' if st.isup else 'down'} - speed {st.speed}")
+            for a in addrs.get(name, ()):
+                items.append(f"   {a.family.name} {a.address}")
+        # one Tcl call to refill, none at all when nothing changed
+        if items != self._prev_items:
+            self.net_list.delete(0, "end")
+            if items:
+                self.net_list.insert("end", *items)
+            self._prev_items = items
+
+    def _publish(self, sample):
+        # latest sample wins: drop an unconsumed one rather than queueing up
+        try:
+            self.q.put_nowait(sample)
+        except queue.Full:
             try:
-                cpu = psutil.cpu_percent(interval=1)
-                ram = psutil.virtual_memory().percent
-                disk = psutil.disk_usage('/').percent
-                net = psutil.net_io_counters()
-                up = (net.bytes_sent - self.prev_net.bytes_sent) / 1024.0
-                down = (net.bytes_recv - self.prev_net.bytes_recv) / 1024.0
-                self.prev_net = net
-                gpu_text = "N/A"
-                if GPUtil_available:
-                    try:
-                        gpus = GPUtil.getGPUs()
-                        if gpus:
-                            g = gpus[0]
-                            gpu_text = f"{g.name} - {g.load*100:.1f}%"
-                    except Exception:
-                        pass
-
-                def upd():
-                    try:
-                        self.cpu_label.config(text=f"CPU: {cpu:.1f}%")
-                        self.ram_label.config(text=f"RAM: {ram:.1f}%")
-                        self.disk_label.config(text=f"Disk: {disk:.1f}%")
-                        self.gpu_label.config(text=f"GPU: {gpu_text}")
-                        if MATPLOTLIB_AVAILABLE:
-                            self.cpu_history.append(cpu); self.cpu_history.pop(0)
-                            self.line.set_data(range(len(self.cpu_history)), self.cpu_history)
-                            self.ax.set_xlim(0, len(self.cpu_history))
-                            self.canvas.draw()
-                        else:
-                            try:
-                                self.cpu_bar['value'] = cpu
-                                self.ram_bar['value'] = ram
-                            except Exception:
-                                pass
-                    except Exception:
-                        pass
+                self.q.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self.q.put_nowait(sample)
+            except queue.Full:
+                pass
 
+    def _pump(self):
+        try:
+            self._update(self.q.get_nowait())
+        except queue.Empty:
+            pass
+        self._pump_after = self.win.after(250, self._pump)
+
+    def _set(self, w, s):
+        # skip the Tcl round-trip and relayout when the text is unchanged
+        if self._last.get(id(w)) != s:
+            w.config(text=s)
+            self._last[id(w)] = s
+
+    def _update(self, sample):
+        cpu, ram = sample["cpu"], sample["ram"]
+        has_plot = MATPLOTLIB_AVAILABLE and self.canvas is not None
+        if has_plot:
+            # history keeps filling while hidden; only the drawing is skipped
+            self._ys[self._cursor] = cpu
+            self._cursor = (self._cursor + 1) % 60
+        if not self._perf_visible:
+            return
+        try:
+            self._set(self.cpu_label, f"CPU: {cpu:.0f}%")
+            self._set(self.ram_label, f"RAM: {ram:.0f}%")
+            self._set(self.disk_label, f"Disk: {sample['disk']:.0f}%")
+            self._set(self.gpu_label, f"GPU: {sample['gpu']}")
+            up, down = sample["net"]
+            self._set(self.net_label, f"Net: up {up:.0f} KB/s, down {down:.0f} KB/s")
+            if has_plot:
+                self.line.set_ydata(self._history())
+                self._blit()
+            else:
                 try:
-                    self.win.after(0, upd)
+                    self.cpu_bar['value'] = cpu
+                    self.ram_bar['value'] = ram
                 except Exception:
-                    upd()
-            except Exception:
-                time.sleep(1)
+                    pass
+        except Exception:
+            pass
 
 
 # ---------- My Computer ----------
+# Partition topology rarely changes; reuse the list across My Computer windows.
+_PARTS_CACHE = {"t": 0.0, "parts": None}
+_PARTS_CACHE_TTL = 60.0
+
+# Remote/automount filesystems whose statfs() can be slow or hang
+_SKIP_FSTYPES = frozenset({"autofs", "nfs", "nfs4", "cifs", "smbfs", "fuse.gvfsd-fuse"})
+
+
+def _get_partitions():
+    now = time.monotonic()
+    if _PARTS_CACHE["parts"] is None or now - _PARTS_CACHE["t"] >= _PARTS_CACHE_TTL:
+        _PARTS_CACHE.update(t=now, parts=psutil.disk_partitions(all=False))
+    return _PARTS_CACHE["parts"]
+
+
+# Give up on a mount's usage after this many seconds and show it as unavailable
+DISK_USAGE_TIMEOUT = 5.0
+
+
+def _disk_usage_async(key, mountpoint, results):
+    """
+    Run psutil.disk_usage on a daemon thread so a hung statfs can't block exit.
+    Puts (key, usage_or_exception) on the results queue.
+    """
+    def _run():
+        try:
+            results.put((key, psutil.disk_usage(mountpoint)))
+        except Exception as e:
+            results.put((key, e))
+    threading.Thread(target=_run, daemon=True).start()
+
+
 class MyComputerApp:
     def __init__(self, win: AppWindow):
         self.win = win
-        tk.Label(win.content, text="Drives", bg=WIN98_PANEL, font=TITLE_FONT).pack(anchor="w", padx=6, pady=6)
-        frame = tk.Frame(win.content, bg=WIN98_PANEL); frame.pack(fill="both", expand=True, padx=6, pady=6)
-        parts = psutil.disk_partitions(all=False)
-        for p in parts:
+        tk.Label(win.content, text="Drives", font=TITLE_FONT).pack(anchor="w", padx=6, pady=6)
+        frame = tk.Frame(win.content); frame.pack(fill="both", expand=True, padx=6, pady=6)
+        parts = _get_partitions()
+        # statfs() can stall on slow mounts: show placeholders now, query usage
+        # on daemon threads and fill the labels in from the Tk thread as results land
+        self._pending = {}
+        self._results = queue.Queue()
+        self._poll_after = None
+        self._deadline = time.monotonic() + DISK_USAGE_TIMEOUT
+        for i, p in enumerate(parts):
+            if p.fstype in _SKIP_FSTYPES:
+                tk.Label(frame, text=f"{p.device} mounted on {p.mountpoint} ({p.fstype})").pack(anchor="w")
+                continue
+            lbl = tk.Label(frame, text=f"{p.device} mounted on {p.mountpoint} …"); lbl.pack(anchor="w")
+            self._pending[i] = (p, lbl)
+            _disk_usage_async(i, p.mountpoint, self._results)
+        if self._pending:
+            self.win.bind("<Destroy>", self._on_destroy, add="+")
+            self._poll_after = self.win.after(50, self._poll_usage)
+
+    def _on_destroy(self, ev):
+        if ev.widget is self.win and self._poll_after is not None:
+            self.win.after_cancel(self._poll_after)
+            self._poll_after = None
+
+    def _poll_usage(self):
+        self._poll_after = None
+        while True:
             try:
-                u = psutil.disk_usage(p.mountpoint)
-                tk.Label(frame, text=f"{p.device} mounted on {p.mountpoint} - {u.percent:.1f}% used ({format_bytes(u.used)}/{format_bytes(u.total)})", bg=WIN98_PANEL).pack(anchor="w")
-            except Exception as e:
-                tk.Label(frame, text=f"{p.device} - {e}", bg=WIN98_PANEL).pack(anchor="w")
+                key, u = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if key not in self._pending:
+                continue  # arrived after the timeout
+            p, lbl = self._pending.pop(key)
+            if isinstance(u, Exception):
+                lbl.config(text=f"{p.device} - {u}")
+            else:
+                lbl.config(text=f"{p.device} mounted on {p.mountpoint} - {u.percent:.1f}% used ({format_bytes(u.used)}/{format_bytes(u.total)})")
+        if self._pending and time.monotonic() >= self._deadline:
+            for p, lbl in self._pending.values():
+                lbl.config(text=f"{p.device} mounted on {p.mountpoint} - unavailable")
+            self._pending.clear()
+        if self._pending:
+            self._poll_after = self.win.after(50, self._poll_usage)
 
 
 # ---------- AppWindow & helpers ----------
@@ -878,15 +1452,14 @@ class AppWindow(tk.Toplevel):
         self.parent = parent
         self.title(title)
         self.geometry(f"{w}x{h}")
-        self.configure(bg=WIN98_PANEL)
         center_window(self)
         self.protocol("WM_DELETE_WINDOW", self._on_close)
-        self.content = tk.Frame(self, bg=WIN98_PANEL)
+        self.content = tk.Frame(self)
         self.content.pack(fill="both", expand=True)
-        threading.Thread(target=play_sound, args=(STARTUP_WAV,), daemon=True).start()
+        play_sound(STARTUP_WAV)
 
     def _on_close(self):
-        threading.Thread(target=play_sound, args=(SHUTDOWN_WAV,), daemon=True).start()
+        play_sound(SHUTDOWN_WAV)
         try:
             self.destroy()
         except Exception:
@@ -895,14 +1468,11 @@ class AppWindow(tk.Toplevel):
 
 # ---------- Main entry ----------
 def main():
-    root = tk.Tk()
-    root.withdraw()
-    def show_desktop():
-        root.destroy()
-        desktop = CinnaDesktop()
-        desktop.mainloop()
-    splash = BootSplash(root, on_done=show_desktop)
-    splash.mainloop()
+    # one Tk root and one mainloop: the desktop waits withdrawn behind the splash
+    desktop = CinnaDesktop()
+    desktop.withdraw()
+    BootSplash(desktop, on_done=desktop.deiconify)
+    desktop.mainloop()
 
 
 if __name__ == "__main__":